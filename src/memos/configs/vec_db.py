@@ -50,6 +50,31 @@ class ChromaVecDBConfig(BaseVecDBConfig):
     database: str | None = Field(default=None, description="Database name for Chroma")
     tenant: str | None = Field(default=None, description="Tenant for Chroma")
     ssl: bool = Field(default=False, description="Use SSL for Chroma connection")
+    batch_size: int = Field(
+        default=100, gt=0, description="Maximum number of items sent to Chroma per upsert request"
+    )
+    search_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Number of recent search results cached client-side (0 disables the cache). "
+            "Only writes made through the same instance invalidate it"
+        ),
+    )
+    id_cache_size: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Number of items cached client-side for lookups by ID (0 disables the cache). "
+            "Only writes made through the same instance invalidate it"
+        ),
+    )
+    max_connections: int = Field(
+        default=64, gt=0, description="Maximum number of pooled HTTP connections to Chroma"
+    )
+    max_keepalive_connections: int = Field(
+        default=32, ge=0, description="Maximum number of idle HTTP connections kept alive"
+    )
 
     @model_validator(mode="after")
     def set_default_path(self):
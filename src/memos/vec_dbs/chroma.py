@@ -1,7 +1,15 @@
+import asyncio
 import base64
+import contextlib
 import json
+import threading
 
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from itertools import repeat
+from typing import Any, ClassVar
+
+import numpy as np
 
 from memos.configs.vec_db import ChromaVecDBConfig
 from memos.dependency import require_python_package
@@ -12,47 +20,231 @@ from memos.vec_dbs.item import VecDBItem
 
 logger = get_logger(__name__)
 
+# Fields requested from `collection.get` unless the caller narrows them. Documents are
+# never read back into a VecDBItem, so they are left out.
+_DEFAULT_GET_INCLUDE = ["metadatas", "embeddings"]
+
+# Fields requested from `collection.query`; vectors and documents are not needed for ranking
+_SEARCH_INCLUDE = ["metadatas", "distances"]
+
+# Metadata value types that Chroma cannot store natively and are kept as JSON strings
+_DICT_OR_LIST = (dict, list)
+
+
+def _column(values: Any) -> Any:
+    """Return a result column, or an endless run of None if Chroma did not include it."""
+    if values is None or len(values) == 0:
+        return repeat(None)
+    return values
+
+
+def _as_lists(vectors: Any) -> Any:
+    """Convert numpy-backed vectors returned by Chroma into plain lists for VecDBItem."""
+    if isinstance(vectors, np.ndarray):
+        return vectors.tolist()
+    if vectors is not None and len(vectors) and isinstance(vectors[0], np.ndarray):
+        return [vector.tolist() for vector in vectors]
+    return vectors
+
+
+def _is_missing_collection(exc: Exception) -> bool:
+    """Whether `exc` reports that the collection no longer exists in Chroma."""
+    from chromadb import errors
+
+    # Releases before 1.0 raise InvalidCollectionException instead of NotFoundError
+    missing = tuple(
+        getattr(errors, name)
+        for name in ("NotFoundError", "InvalidCollectionException")
+        if hasattr(errors, name)
+    )
+    return isinstance(exc, missing)
+
+
+def _release_client(client: Any) -> None:
+    """Close a Chroma client; releases before 1.0 have no `close` and are simply dropped."""
+    close = getattr(client, "close", None)
+    if close is not None:
+        close()
+
+
+def _copy_items(items: list[VecDBItem]) -> list[VecDBItem]:
+    """Deep-copy cached items before handing them to a caller."""
+    return [item.model_copy(deep=True) for item in items]
+
+
+class _LRUCache:
+    """A small thread-safe least-recently-used cache."""
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for `key` and mark it as recently used."""
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting the least recently used entry when full."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove `key` if it is cached."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
 
 class ChromaVecDB(BaseVecDB):
     """Chroma vector database implementation."""
 
+    _clients: ClassVar[dict[tuple, Any]] = {}
+    _client_refs: ClassVar[dict[tuple, int]] = {}
+    _clients_lock: ClassVar[threading.Lock] = threading.Lock()
+
     @require_python_package(import_name="chromadb", install_command="pip install chromadb-client")
     def __init__(self, config: ChromaVecDBConfig):
         """Initialize the Chroma vector database and the collection."""
-        from chromadb import HttpClient, PersistentClient
-        from chromadb.config import DEFAULT_DATABASE, DEFAULT_TENANT
-
         self.config = config
+        # Cached collection handle, refreshed after a delete or once Chroma reports it missing
+        self._collection = None
+        self._collection_lock = threading.Lock()
+        # Async client and collection handle used by `aadd`, created lazily on first use
+        # in HTTP mode
+        self._async_client = None
+        self._async_collection = None
+        self._async_collection_lock = asyncio.Lock()
+        self._http_headers: dict[str, str] = {}
+        # Recent search results; any write to the collection clears it
+        self._search_cache = _LRUCache(self.config.search_cache_size)
+        # Fully hydrated items by ID; writes evict the IDs they touch
+        self._id_cache = _LRUCache(self.config.id_cache_size)
+        # Bumped around every write so reads that started earlier do not cache stale results
+        self._cache_epoch = 0
+        self._writes_in_flight = 0
+        self._cache_state_lock = threading.Lock()
 
         # If both host and port are None, we are running in local mode
         if self.config.host is None and self.config.port is None:
             logger.warning("Chroma is running in local mode (host and port are both None). ")
-            self.client = PersistentClient(
-                path=self.config.path,
-                database=self.config.database or DEFAULT_DATABASE,
-                tenant=self.config.tenant or DEFAULT_TENANT,
-            )
         else:
-            auth_credentials = f"{self.config.username}:{self.config.password}"
+            self._http_headers = {
+                "Authorization": self._encode_auth(self.config.username, self.config.password)
+            }
+
+        # Instances pointing at the same Chroma target share a single client
+        self._client_key: tuple | None = self._get_client_key(self.config)
+        with self._clients_lock:
+            if self._client_key not in self._clients:
+                self._clients[self._client_key] = self._create_client()
+            self._client_refs[self._client_key] = self._client_refs.get(self._client_key, 0) + 1
+            self.client = self._clients[self._client_key]
+
+        self.create_collection()
+
+    @staticmethod
+    def _get_client_key(config: ChromaVecDBConfig) -> tuple:
+        """Identify the Chroma target, credentials and pool sizes a client is created with."""
+        return (
+            config.host,
+            config.port,
+            config.path,
+            config.tenant,
+            config.database,
+            config.username,
+            config.password,
+            config.ssl,
+            config.max_connections,
+            config.max_keepalive_connections,
+        )
+
+    def _create_client(self) -> Any:
+        """Create a local PersistentClient or an HttpClient, depending on the config."""
+        from chromadb import HttpClient, PersistentClient
+        from chromadb.config import DEFAULT_DATABASE, DEFAULT_TENANT
 
-            encoded_credentials = base64.b64encode(auth_credentials.encode("utf-8")).decode("utf-8")
-            self.client = HttpClient(
-                host=self.config.host,
-                port=self.config.port,
-                headers={"Authorization": f"Basic {encoded_credentials}"},
+        if self.config.host is None and self.config.port is None:
+            return PersistentClient(
+                path=self.config.path,
                 database=self.config.database or DEFAULT_DATABASE,
                 tenant=self.config.tenant or DEFAULT_TENANT,
-                ssl=self.config.ssl,
             )
 
-        self.create_collection()
+        return HttpClient(
+            host=self.config.host,
+            port=self.config.port,
+            headers=self._http_headers,
+            database=self.config.database or DEFAULT_DATABASE,
+            tenant=self.config.tenant or DEFAULT_TENANT,
+            ssl=self.config.ssl,
+            settings=self._http_settings(),
+        )
+
+    def close(self) -> None:
+        """Release this instance's reference to the shared client, closing it when unused."""
+        with self._clients_lock:
+            if self._client_key is None:
+                return
+            refs = self._client_refs.get(self._client_key, 1) - 1
+            if refs > 0:
+                self._client_refs[self._client_key] = refs
+            else:
+                self._client_refs.pop(self._client_key, None)
+                client = self._clients.pop(self._client_key, None)
+                if client is not None:
+                    _release_client(client)
+            self._client_key = None
+        self._collection = None
+        self._async_collection = None
+        if self._async_client is not None:
+            _release_client(self._async_client)
+            self._async_client = None
+
+    def _http_settings(self):
+        """Build Chroma client settings that size the HTTP connection pool from the config."""
+        from chromadb.config import Settings
+
+        settings = Settings()
+        # Older chromadb releases hard-code their httpx pool limits and lack these settings
+        if hasattr(settings, "chroma_http_max_connections"):
+            settings.chroma_http_max_connections = self.config.max_connections
+            settings.chroma_http_max_keepalive_connections = self.config.max_keepalive_connections
+        return settings
+
+    @staticmethod
+    def _encode_auth(username: str | None, password: str | None) -> str:
+        """Build the Basic auth header value for the given credentials."""
+        auth_credentials = f"{username}:{password}"
+        encoded_credentials = base64.b64encode(auth_credentials.encode("utf-8")).decode("utf-8")
+        return f"Basic {encoded_credentials}"
 
     @staticmethod
     def serialize_metadata(d: dict) -> dict:
-        """Return a copy of the dict with list/dict values converted to JSON strings."""
+        """
+        Return a copy of the dict with list/dict values converted to JSON strings.
+
+        A dict holding only scalar values is returned as is, without copying.
+        """
+        if not any(isinstance(value, _DICT_OR_LIST) for value in d.values()):
+            return d
+
         result = {}
         for key, value in d.items():
-            if isinstance(value, dict | list):
+            if isinstance(value, _DICT_OR_LIST):
                 result[key] = json.dumps(value)
             else:
                 result[key] = value
@@ -63,37 +255,53 @@ class ChromaVecDB(BaseVecDB):
         """Return a copy of the dict with JSON string values parsed back to dict or list."""
         result = {}
         for key, value in d.items():
-            if isinstance(value, str):
-                try:
-                    parsed = json.loads(value)
-                    if isinstance(parsed, dict | list):
-                        result[key] = parsed
-                    else:
-                        result[key] = value
-                except (json.JSONDecodeError, TypeError):
-                    result[key] = value
-            else:
+            # Only strings that look like a JSON object/array can have come from serialize_metadata
+            if not (isinstance(value, str) and value[:1] in ("{", "[")):
+                result[key] = value
+                continue
+            try:
+                parsed = json.loads(value)
+            except ValueError:
                 result[key] = value
+                continue
+            result[key] = parsed if isinstance(parsed, _DICT_OR_LIST) else value
         return result
 
     def get_collection(self):
-        """Get a collection by name."""
-        try:
-            return self.client.get_collection(self.config.collection_name)
-        except Exception:
-            self.create_collection()
-            return self.client.get_collection(self.config.collection_name)
+        """Get the configured collection, fetching the handle only on first use."""
+        if self._collection is None:
+            with self._collection_lock:
+                if self._collection is None:
+                    self.create_collection()
+        return self._collection
+
+    def _call_collection(self, method: str, **kwargs: Any) -> Any:
+        """
+        Call `method` on the cached collection handle.
 
-    def create_collection(self) -> None:
-        if self.collection_exists(self.config.collection_name):
+        If the collection was deleted elsewhere (e.g. by another instance sharing the
+        client), the stale handle is dropped and the call is retried once on a
+        recreated collection.
+        """
+        collection = self.get_collection()
+        try:
+            return getattr(collection, method)(**kwargs)
+        except Exception as e:
+            if not _is_missing_collection(e):
+                raise
             logger.warning(
-                f"Collection '{self.config.collection_name}' already exists. Skipping creation."
+                f"Collection '{self.config.collection_name}' no longer exists, recreating it"
             )
-            return
+            with self._collection_lock:
+                if self._collection is collection:
+                    self._collection = None
+            return getattr(self.get_collection(), method)(**kwargs)
 
-        self.client.create_collection(name=self.config.collection_name)
+    def create_collection(self) -> None:
+        """Create the configured collection if needed and cache its handle."""
+        self._collection = self.client.get_or_create_collection(name=self.config.collection_name)
 
-        logger.info(f"Collection '{self.config.collection_name}' created")
+        logger.info(f"Collection '{self.config.collection_name}' is ready")
 
     def list_collections(self) -> list[str]:
         """List all collections."""
@@ -102,7 +310,15 @@ class ChromaVecDB(BaseVecDB):
 
     def delete_collection(self, name: str) -> None:
         """Delete a collection."""
-        self.client.delete_collection(name=name)
+        if name != self.config.collection_name:
+            self.client.delete_collection(name=name)
+            return
+
+        with self._writing([]):
+            self.client.delete_collection(name=name)
+            self._collection = None
+            self._async_collection = None
+            self._id_cache.clear()
 
     def collection_exists(self, name: str) -> bool:
         """Check if a collection exists."""
@@ -126,95 +342,231 @@ class ChromaVecDB(BaseVecDB):
         Returns:
             List of search results with distance scores and payloads.
         """
-
-        response = self.get_collection().query(
-            query_embeddings=query_vector,
+        query_array = np.asarray(query_vector, dtype=np.float32)
+        use_cache = self._search_cache.max_size > 0
+        if use_cache:
+            # Chroma compares vectors as float32, so equal float32 bytes mean an equal query
+            cache_key = (
+                query_array.tobytes(),
+                top_k,
+                json.dumps(filter, sort_keys=True) if filter else None,
+            )
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                return _copy_items(cached)
+            epoch = self._cache_epoch
+
+        response = self._call_collection(
+            "query",
+            query_embeddings=[query_array],
             n_results=top_k,
             where_document=filter,
+            include=_SEARCH_INCLUDE,
         )
         logger.info(f"ChromaDb search completed with {len(response)} results.")
-        return [
+        embeddings = (
+            _as_lists(response["embeddings"][0]) if response["embeddings"] is not None else None
+        )
+        metadatas = response["metadatas"][0] if response["metadatas"] is not None else None
+        deserialize_metadata = self.deserialize_metadata
+        results = [
             VecDBItem(
-                id=response["ids"][0][idx],
-                vector=response["embeddings"][0][idx] if response["embeddings"] else None,
-                payload=self.deserialize_metadata(response["metadatas"][0][idx])
-                if response["metadatas"]
-                else None,
-                score=response["distances"][0][idx] if response["distances"][0] else None,
+                id=id,
+                vector=vector,
+                payload=deserialize_metadata(metadata) if metadata else None,
+                score=score,
+            )
+            for id, vector, metadata, score in zip(
+                response["ids"][0],
+                _column(embeddings),
+                _column(metadatas),
+                _column(response["distances"][0]),
+                strict=False,
             )
-            for idx, _ in enumerate(response["ids"][0])
         ]
+        if use_cache:
+            with self._cache_state_lock:
+                if self._is_cacheable(epoch):
+                    self._search_cache.put(cache_key, results)
+            # Hand out copies so callers editing an item cannot corrupt later cache hits
+            return _copy_items(results)
+        return results
+
+    def invalidate_search_cache(self) -> None:
+        """Drop all cached search results."""
+        self._search_cache.clear()
+
+    def _invalidate_caches(self, ids: list[str]) -> None:
+        """Drop cached search results and the cached items for the written IDs."""
+        self.invalidate_search_cache()
+        for id in ids:
+            self._id_cache.pop(id)
+
+    @contextlib.contextmanager
+    def _writing(self, ids: list[str]) -> Iterator[None]:
+        """
+        Invalidate the caches for `ids` before and after a write, even if it fails.
 
-    def get_by_id(self, id: str) -> VecDBItem | None:
-        """Get a single item by ID."""
-        response = self.get_collection().get(ids=[id])
-
-        if not response["ids"]:
-            return None
-
-        return VecDBItem(
-            id=response["ids"][0],
-            vector=response["embeddings"][0],
-            payload=self.deserialize_metadata(response["metadatas"][0]),
-        )
+        While the write is in flight, and for reads that started before it, results are
+        not cached, so a reader cannot put back an item the write has replaced.
+        """
+        with self._cache_state_lock:
+            self._cache_epoch += 1
+            self._writes_in_flight += 1
+            self._invalidate_caches(ids)
+        try:
+            yield
+        finally:
+            with self._cache_state_lock:
+                self._cache_epoch += 1
+                self._writes_in_flight -= 1
+                self._invalidate_caches(ids)
 
-    def get_by_ids(self, ids: list[str]) -> list[VecDBItem]:
-        """Get multiple items by their IDs."""
+    def _is_cacheable(self, epoch: int) -> bool:
+        """Whether a read that started at `epoch` may be cached; call with the state lock held."""
+        return self._writes_in_flight == 0 and epoch == self._cache_epoch
 
-        response = self.get_collection().get(ids=ids)
+    def get_by_id(self, id: str) -> VecDBItem | None:
+        """Get a single item by ID."""
+        items = self.get_by_ids([id])
+        return items[0] if items else None
 
-        if not response["ids"]:
-            return []
+    def get_by_ids(self, ids: list[str], include: list[str] | None = None) -> list[VecDBItem]:
+        """
+        Get multiple items by their IDs.
 
-        return [
-            VecDBItem(
-                id=response["ids"][idx],
-                vector=self.deserialize_metadata(response["embeddings"][idx])
-                if response["embeddings"]
-                else None,
-                payload=response["metadatas"][idx] if response["metadatas"] else None,
-            )
-            for idx, _ in enumerate(response["ids"])
-        ]
+        Fully hydrated items are served from the ID cache when possible, so only
+        uncached IDs are requested from Chroma.
 
-    def get_by_filter(self, filter: dict[str, Any], limit: int = 100) -> list[VecDBItem]:
+        Args:
+            ids: IDs of the items to retrieve
+            include: Fields to fetch from Chroma; leave out "embeddings" to skip vectors
+        """
+        if include is None:
+            include = _DEFAULT_GET_INCLUDE
+        if not self._is_hydrated(include):
+            response = self._call_collection("get", ids=ids, include=include)
+            return self._rows_to_items(response, include) if response["ids"] else []
+
+        found = {
+            id: item.model_copy(deep=True)
+            for id in ids
+            if (item := self._id_cache.get(id)) is not None
+        }
+        missing = [id for id in ids if id not in found]
+        if missing:
+            epoch = self._cache_epoch
+            response = self._call_collection("get", ids=missing, include=include)
+            if response["ids"]:
+                items = self._cache_items(self._rows_to_items(response, include), epoch)
+                found.update((item.id, item) for item in items)
+
+        return [found[id] for id in ids if id in found]
+
+    def get_by_filter(
+        self, filter: dict[str, Any], limit: int = 100, include: list[str] | None = None
+    ) -> list[VecDBItem]:
         """
         Retrieve all items that match the given filter criteria.
 
         Args:
             filter: Payload filters to match against stored items
-            limit: Maximum number of items to retrieve per scroll request
+            limit: Maximum total number of items to retrieve; pages are fetched via `iter_by_filter`
+            include: Fields to fetch from Chroma; leave out "embeddings" to skip vectors
 
         Returns:
             List of items including vectors and payload that match the filter"""
+        items = list(self.iter_by_filter(filter, limit=limit, include=include))
 
-        response = self.get_collection().get(where=filter, limit=limit)
+        logger.info(f"Chroma retrieve by filter completed with {len(items)} results.")
 
-        logger.info(f"Chroma retrieve by filter completed with {len(response['ids'])} results.")
+        return items
 
-        if not response["ids"]:
-            return []
+    def iter_by_filter(
+        self,
+        filter: dict[str, Any],
+        page_size: int = 1000,
+        limit: int | None = None,
+        include: list[str] | None = None,
+    ) -> Iterator[VecDBItem]:
+        """
+        Lazily iterate over items that match the given filter, one page at a time.
+
+        Args:
+            filter: Payload filters to match against stored items
+            page_size: Number of items fetched from Chroma per request
+            limit: Maximum total number of items to yield, or None for all matches
+            include: Fields to fetch from Chroma; leave out "embeddings" to skip vectors
 
-        return [
+        Yields:
+            Items including vectors and payload that match the filter
+        """
+        if include is None:
+            include = _DEFAULT_GET_INCLUDE
+        offset = 0
+        while limit is None or offset < limit:
+            page_limit = page_size if limit is None else min(page_size, limit - offset)
+            epoch = self._cache_epoch
+            response = self._call_collection(
+                "get", where=filter or None, limit=page_limit, offset=offset, include=include
+            )
+            if not response["ids"]:
+                return
+
+            items = self._rows_to_items(response, include)
+            yield from self._cache_items(items, epoch) if self._is_hydrated(include) else items
+
+            if len(response["ids"]) < page_limit:
+                return
+            offset += page_limit
+
+    def _rows_to_items(self, response: dict[str, Any], include: list[str]) -> list[VecDBItem]:
+        """Convert the column-oriented result of `collection.get` into VecDBItems."""
+        embeddings = _as_lists(response["embeddings"]) if "embeddings" in include else None
+        metadatas = response["metadatas"] if "metadatas" in include else None
+        deserialize_metadata = self.deserialize_metadata
+        items = [
             VecDBItem(
-                id=response["ids"][idx],
-                vector=self.deserialize_metadata(response["embeddings"][idx])
-                if response["embeddings"]
-                else None,
-                payload=response["metadatas"][idx] if response["metadatas"] else None,
+                id=id,
+                vector=vector,
+                payload=deserialize_metadata(metadata) if metadata else None,
+            )
+            for id, vector, metadata in zip(
+                response["ids"], _column(embeddings), _column(metadatas), strict=False
             )
-            for idx, _ in enumerate(response["ids"])
         ]
+        return items
 
-    def get_all(self, limit=100) -> list[VecDBItem]:
+    def _cache_items(self, items: list[VecDBItem], epoch: int) -> list[VecDBItem]:
+        """
+        Cache fully hydrated items fetched by a read that started at `epoch`.
+
+        Returns copies of the cached items, so callers editing them cannot corrupt the cache.
+        """
+        if self._id_cache.max_size <= 0:
+            return items
+        with self._cache_state_lock:
+            if self._is_cacheable(epoch):
+                for item in items:
+                    self._id_cache.put(item.id, item)
+        return _copy_items(items)
+
+    @staticmethod
+    def _is_hydrated(include: list[str]) -> bool:
+        """Whether items fetched with `include` carry both vector and payload."""
+        return "embeddings" in include and "metadatas" in include
+
+    def get_all(self, limit=100, include: list[str] | None = None) -> list[VecDBItem]:
         """Retrieve all items in the vector database."""
-        return self.get_by_filter({}, limit=limit)
+        return self.get_by_filter({}, limit=limit, include=include)
 
     def count(self, filter: dict[str, Any] | None = None) -> int:
         """Count items in the database, optionally with filter."""
+        if not filter:
+            return self._call_collection("count")
 
-        response = self.get_by_filter(filter)
-        return len(response)
+        # Only the ids are needed to count matches
+        return len(self._call_collection("get", where=filter, include=[])["ids"])
 
     def add(self, data: list[VecDBItem | dict[str, Any]]) -> None:
         """
@@ -226,22 +578,98 @@ class ChromaVecDB(BaseVecDB):
                 - 'vector': embedding vector
                 - 'payload': additional fields for filtering/retrieval
         """
-        ids = []
-        embeddings = []
-        metadatas = []
-        documents = []
-        for item in data:
-            if isinstance(item, dict):
-                item = VecDBItem.from_dict(item)
-            ids.append(str(item.id))
-            embeddings.append(item.vector)
-            metadatas.append(self.serialize_metadata(item.payload))
-            documents.append(item.payload.get("memory"))
-
-        self.get_collection().upsert(
-            ids=ids, embeddings=embeddings, metadatas=metadatas, documents=documents
+        ids, embeddings, metadatas, documents = self._prepare_upsert(data)
+
+        batch_size = self.config.batch_size
+        with self._writing(ids):
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                self._call_collection(
+                    "upsert",
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end],
+                    documents=documents[start:end],
+                )
+
+    async def aadd(self, data: list[VecDBItem | dict[str, Any]], concurrency: int = 2) -> None:
+        """
+        Add data to the vector database, sending up to `concurrency` batches at a time.
+
+        In local mode there is no network round-trip to overlap, so this simply runs
+        `add` in a worker thread.
+
+        Args:
+            data: List of VecDBItem objects or dictionaries (see `add`)
+            concurrency: Maximum number of upsert requests in flight
+        """
+        if self.config.host is None and self.config.port is None:
+            await asyncio.to_thread(self.add, data)
+            return
+
+        ids, embeddings, metadatas, documents = self._prepare_upsert(data)
+
+        collection = await self._get_async_collection()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def upsert_batch(start: int, end: int) -> None:
+            async with semaphore:
+                await collection.upsert(
+                    ids=ids[start:end],
+                    embeddings=embeddings[start:end],
+                    metadatas=metadatas[start:end],
+                    documents=documents[start:end],
+                )
+
+        batch_size = self.config.batch_size
+        with self._writing(ids):
+            await asyncio.gather(
+                *(
+                    upsert_batch(start, start + batch_size)
+                    for start in range(0, len(ids), batch_size)
+                )
+            )
+
+    async def _get_async_collection(self):
+        """Get the configured collection through an async HTTP client, creating it on first use."""
+        if self._async_collection is None:
+            # Concurrent `aadd` calls must not each create their own client
+            async with self._async_collection_lock:
+                if self._async_collection is None:
+                    if self._async_client is None:
+                        self._async_client = await self._create_async_client()
+                    self._async_collection = await self._async_client.get_or_create_collection(
+                        name=self.config.collection_name
+                    )
+        return self._async_collection
+
+    async def _create_async_client(self) -> Any:
+        """Create an AsyncHttpClient with the same headers and pool settings as the sync one."""
+        from chromadb import AsyncHttpClient
+        from chromadb.config import DEFAULT_DATABASE, DEFAULT_TENANT
+
+        return await AsyncHttpClient(
+            host=self.config.host,
+            port=self.config.port,
+            headers=self._http_headers,
+            database=self.config.database or DEFAULT_DATABASE,
+            tenant=self.config.tenant or DEFAULT_TENANT,
+            ssl=self.config.ssl,
+            settings=self._http_settings(),
         )
 
+    def _prepare_upsert(
+        self, data: list[VecDBItem | dict[str, Any]]
+    ) -> tuple[list[str], np.ndarray, list[dict], list[str | None]]:
+        """Split items into the parallel id/embedding/metadata/document lists Chroma expects."""
+        items = [VecDBItem.from_dict(item) if isinstance(item, dict) else item for item in data]
+        ids = [str(item.id) for item in items]
+        # One contiguous float32 buffer; batches are then sliced as views without copying
+        embeddings = np.asarray([item.vector for item in items], dtype=np.float32)
+        metadatas = [self.serialize_metadata(item.payload) for item in items]
+        documents = [item.payload.get("memory") for item in items]
+        return ids, embeddings, metadatas, documents
+
     def update(self, id: str, data: VecDBItem | dict[str, Any]) -> None:
         """Update an item in the vector database."""
 
@@ -250,17 +678,21 @@ class ChromaVecDB(BaseVecDB):
 
         if data.vector:
             # For vector updates (with or without payload), use upsert with the same ID
-            self.get_collection().upsert(
-                ids=[id],
-                embeddings=[data.vector],
-                metadatas=[self.serialize_metadata(data.payload.get("metadata"))],
-                documents=[data.payload.get("memory")],
-            )
+            embeddings = np.asarray([data.vector], dtype=np.float32)
+            metadata = self.serialize_metadata(data.payload.get("metadata"))
+            with self._writing([id]):
+                self._call_collection(
+                    "upsert",
+                    ids=[id],
+                    embeddings=embeddings,
+                    metadatas=[metadata],
+                    documents=[data.payload.get("memory")],
+                )
         else:
             # For payload-only updates
-            self.get_collection().upsert(
-                ids=[id], metadatas=[self.serialize_metadata(data.payload.get("metadata"))]
-            )
+            metadata = self.serialize_metadata(data.payload.get("metadata"))
+            with self._writing([id]):
+                self._call_collection("upsert", ids=[id], metadatas=[metadata])
 
     def upsert(self, data: list[VecDBItem | dict[str, Any]]) -> None:
         """
@@ -273,7 +705,8 @@ class ChromaVecDB(BaseVecDB):
 
     def delete(self, ids: list[str]) -> None:
         """Delete items from the vector database."""
-        self.get_collection().delete(ids=ids)
+        with self._writing(ids):
+            self._call_collection("delete", ids=ids)
 
     def ensure_payload_indexes(self, fields: list[str]) -> None:
         """
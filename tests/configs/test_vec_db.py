@@ -74,6 +74,11 @@ def test_chroma_vec_db_config():
             "database",
             "tenant",
             "ssl",
+            "batch_size",
+            "search_cache_size",
+            "id_cache_size",
+            "max_connections",
+            "max_keepalive_connections",
         ],
     )
 
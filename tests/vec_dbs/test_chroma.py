@@ -1,15 +1,27 @@
+import asyncio
 import uuid
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 
 from memos import settings
 from memos.configs.vec_db import VectorDBConfigFactory
+from memos.vec_dbs.chroma import ChromaVecDB
 from memos.vec_dbs.factory import VecDBFactory
 from memos.vec_dbs.item import VecDBItem
 
 
+@pytest.fixture(autouse=True)
+def reset_shared_clients():
+    ChromaVecDB._clients.clear()
+    ChromaVecDB._client_refs.clear()
+    yield
+    ChromaVecDB._clients.clear()
+    ChromaVecDB._client_refs.clear()
+
+
 @pytest.fixture
 def config():
     config = VectorDBConfigFactory.model_validate(
@@ -33,8 +45,17 @@ def mock_chroma_client():
 
 
 @pytest.fixture
-def vec_db(config, mock_chroma_client):
-    return VecDBFactory.from_config(config)
+def mock_collection(mock_chroma_client):
+    collection = MagicMock()
+    mock_chroma_client.return_value.get_or_create_collection.return_value = collection
+    return collection
+
+
+@pytest.fixture
+def vec_db(config, mock_chroma_client, mock_collection):
+    vec_db = VecDBFactory.from_config(config)
+    yield vec_db
+    vec_db.close()
 
 
 def test_create_collection(vec_db):
@@ -51,7 +72,7 @@ def test_list_collections(vec_db):
     assert collections == ["test_collection"]
 
 
-def test_add_and_get_by_id(vec_db):
+def test_add_and_get_by_id(vec_db, mock_collection):
     id = str(uuid.uuid4())
     test_data = [
         {
@@ -60,9 +81,6 @@ def test_add_and_get_by_id(vec_db):
             "payload": {"metadata": {"tag": "sample"}, "memory": "mem"},
         }
     ]
-    mock_collection = MagicMock()
-    # Patch get_collection before calling add
-    vec_db.client.get_collection.return_value = mock_collection
     vec_db.add(test_data)
     # Mock get return value
     mock_collection.get.return_value = {
@@ -76,22 +94,18 @@ def test_add_and_get_by_id(vec_db):
     assert result.payload["tag"] == "sample"
 
 
-def test_update_vector(vec_db):
+def test_update_vector(vec_db, mock_collection):
     id = str(uuid.uuid4())
     data = {
         "id": id,
         "vector": [0.4, 0.5, 0.6],
         "payload": {"metadata": {"new": "data"}, "memory": "mem"},
     }
-    mock_collection = MagicMock()
-    vec_db.client.get_collection.return_value = mock_collection
     vec_db.update(id, data)
     mock_collection.upsert.assert_called_once()
 
 
-def test_update_payload_only(vec_db):
-    mock_collection = MagicMock()
-    vec_db.client.get_collection.return_value = mock_collection
+def test_update_payload_only(vec_db, mock_collection):
     vec_db.update(
         str(uuid.uuid4()),
         {"id": str(uuid.uuid4()), "payload": {"metadata": {"only": "payload"}, "memory": "mem"}},
@@ -99,17 +113,23 @@ def test_update_payload_only(vec_db):
     mock_collection.upsert.assert_called_once()
 
 
-def test_delete(vec_db):
-    mock_collection = MagicMock()
-    vec_db.client.get_collection.return_value = mock_collection
+def test_delete(vec_db, mock_collection):
     vec_db.delete(["1", "2"])
     mock_collection.delete.assert_called_once()
 
 
-def test_count(vec_db):
-    vec_db.get_by_filter = MagicMock(return_value=[1, 2, 3, 4, 5])
+def test_count(vec_db, mock_collection):
+    mock_collection.count.return_value = 5
     count = vec_db.count()
     assert count == 5
+    mock_collection.get.assert_not_called()
+
+
+def test_count_with_filter(vec_db, mock_collection):
+    mock_collection.get.return_value = {"ids": ["1", "2"]}
+    count = vec_db.count({"tag": "sample"})
+    assert count == 2
+    mock_collection.get.assert_called_once_with(where={"tag": "sample"}, include=[])
 
 
 def test_get_all(vec_db):
@@ -119,3 +139,354 @@ def test_get_all(vec_db):
     results = vec_db.get_all()
     assert len(results) == 1
     assert isinstance(results[0], VecDBItem)
+
+
+def test_get_collection_is_cached(vec_db, mock_collection):
+    vec_db.client.get_or_create_collection.assert_called_once()
+    vec_db.delete(["1"])
+    vec_db.delete(["2"])
+    vec_db.client.get_or_create_collection.assert_called_once()
+    vec_db.client.get_collection.assert_not_called()
+    assert vec_db.get_collection() is mock_collection
+
+    vec_db.delete_collection("test_collection")
+    vec_db.get_collection()
+    assert vec_db.client.get_or_create_collection.call_count == 2
+
+
+def test_collection_deleted_elsewhere_is_recreated(vec_db, mock_chroma_client, mock_collection):
+    from chromadb.errors import NotFoundError
+
+    stale = MagicMock()
+    stale.count.side_effect = NotFoundError("Collection [test_collection] does not exist")
+    vec_db._collection = stale
+    mock_collection.count.return_value = 5
+
+    assert vec_db.count() == 5
+    assert vec_db.get_collection() is mock_collection
+    assert mock_chroma_client.return_value.get_or_create_collection.call_count == 2
+
+
+def test_add_upserts_in_batches(vec_db, mock_collection):
+    vec_db.config.batch_size = 2
+    test_data = [
+        {
+            "id": str(uuid.uuid4()),
+            "vector": [0.1, 0.2, 0.3],
+            "payload": {"tag": f"sample-{i}", "memory": f"mem-{i}"},
+        }
+        for i in range(5)
+    ]
+    vec_db.add(test_data)
+    assert mock_collection.upsert.call_count == 3
+    batch_sizes = [len(call.kwargs["ids"]) for call in mock_collection.upsert.call_args_list]
+    assert batch_sizes == [2, 2, 1]
+    embeddings = mock_collection.upsert.call_args_list[0].kwargs["embeddings"]
+    assert embeddings.dtype == np.float32
+    assert embeddings.shape == (2, 3)
+
+
+async def test_aadd_upserts_batches_concurrently(vec_db):
+    vec_db.config.host = "localhost"
+    vec_db.config.port = 8000
+    vec_db.config.batch_size = 2
+    async_collection = MagicMock()
+    async_collection.upsert = AsyncMock()
+    vec_db._async_collection = async_collection
+    test_data = [
+        {
+            "id": str(uuid.uuid4()),
+            "vector": [0.1, 0.2, 0.3],
+            "payload": {"tag": f"sample-{i}", "memory": f"mem-{i}"},
+        }
+        for i in range(5)
+    ]
+    await vec_db.aadd(test_data, concurrency=2)
+    assert async_collection.upsert.await_count == 3
+
+
+async def test_aadd_creates_async_client_once():
+    config = VectorDBConfigFactory.model_validate(
+        {
+            "backend": "chroma",
+            "config": {
+                "collection_name": "test_collection",
+                "host": "localhost",
+                "port": 8000,
+                "max_connections": 16,
+            },
+        }
+    )
+    async_client = MagicMock()
+    async_collection = MagicMock()
+    async_collection.upsert = AsyncMock()
+    async_client.get_or_create_collection = AsyncMock(return_value=async_collection)
+    with (
+        patch("chromadb.HttpClient"),
+        patch("chromadb.AsyncHttpClient", AsyncMock(return_value=async_client)) as mock_async,
+    ):
+        vec_db = VecDBFactory.from_config(config)
+        data = [{"id": str(uuid.uuid4()), "vector": [0.1, 0.2, 0.3], "payload": {"memory": "m"}}]
+        await asyncio.gather(vec_db.aadd(data), vec_db.aadd(data))
+        vec_db.close()
+
+    mock_async.assert_awaited_once()
+    kwargs = mock_async.call_args.kwargs
+    assert kwargs["headers"]["Authorization"].startswith("Basic ")
+    if hasattr(kwargs["settings"], "chroma_http_max_connections"):
+        assert kwargs["settings"].chroma_http_max_connections == 16
+    async_client.get_or_create_collection.assert_awaited_once_with(name="test_collection")
+    assert async_collection.upsert.await_count == 2
+    async_client.close.assert_called_once()
+
+
+def test_metadata_serialization_roundtrip():
+    metadata = {
+        "tags": ["a", "b"],
+        "info": {"source": "chat"},
+        "memory": "[not json",
+        "key": "plain",
+        "count": 3,
+    }
+    serialized = ChromaVecDB.serialize_metadata(metadata)
+    assert isinstance(serialized["tags"], str)
+    assert isinstance(serialized["info"], str)
+    assert ChromaVecDB.deserialize_metadata(serialized) == metadata
+
+    scalar_metadata = {"tag": "sample", "memory": "mem", "count": 3}
+    assert ChromaVecDB.serialize_metadata(scalar_metadata) is scalar_metadata
+
+
+def test_metadata_serialization_non_str_keys_and_numpy():
+    metadata = {"info": {1: "a"}, "scores": [np.float64(0.5), 2**70]}
+    serialized = ChromaVecDB.serialize_metadata(metadata)
+    assert ChromaVecDB.deserialize_metadata(serialized) == {
+        "info": {"1": "a"},
+        "scores": [0.5, 2**70],
+    }
+
+
+def test_search_cache_disabled_by_default(vec_db, mock_collection):
+    mock_collection.query.return_value = {
+        "ids": [[str(uuid.uuid4())]],
+        "embeddings": None,
+        "metadatas": [[{"tag": "sample"}]],
+        "distances": [[0.1]],
+    }
+    vec_db.search([0.1, 0.2, 0.3], top_k=1)
+    vec_db.search([0.1, 0.2, 0.3], top_k=1)
+    assert mock_collection.query.call_count == 2
+
+
+def test_search(vec_db, mock_collection):
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    mock_collection.query.return_value = {
+        "ids": [ids],
+        "embeddings": None,
+        "metadatas": [[{"tags": '["a"]'}, {"tags": '["b"]'}]],
+        "distances": [[0.1, 0.2]],
+    }
+    results = vec_db.search([0.1, 0.2, 0.3], top_k=2)
+    assert mock_collection.query.call_args.kwargs["include"] == ["metadatas", "distances"]
+    assert [r.id for r in results] == ids
+    assert [r.score for r in results] == [0.1, 0.2]
+    assert results[0].vector is None
+    assert results[1].payload == {"tags": ["b"]}
+
+
+def test_get_by_filter_without_embeddings(vec_db, mock_collection):
+    id = str(uuid.uuid4())
+    mock_collection.get.return_value = {
+        "ids": [id],
+        "embeddings": None,
+        "metadatas": [{"tag": "sample"}],
+    }
+    results = vec_db.get_by_filter({"tag": "sample"}, include=["metadatas"])
+    mock_collection.get.assert_called_once_with(
+        where={"tag": "sample"}, limit=100, offset=0, include=["metadatas"]
+    )
+    assert results[0].id == id
+    assert results[0].vector is None
+
+
+def test_get_by_ids(vec_db, mock_collection):
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    mock_collection.get.return_value = {
+        "ids": ids,
+        "embeddings": [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]],
+        "metadatas": [{"tags": '["a", "b"]'}, None],
+    }
+    results = vec_db.get_by_ids(ids)
+    assert [r.vector for r in results] == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+    assert results[0].payload == {"tags": ["a", "b"]}
+    assert results[1].payload is None
+
+
+def test_get_by_ids_with_empty_include(vec_db, mock_collection):
+    ids = [str(uuid.uuid4())]
+    mock_collection.get.return_value = {"ids": ids, "embeddings": None, "metadatas": None}
+    results = vec_db.get_by_ids(ids, include=[])
+    mock_collection.get.assert_called_once_with(ids=ids, include=[])
+    assert [r.id for r in results] == ids
+    assert results[0].vector is None
+    assert results[0].payload is None
+
+
+def test_iter_by_filter_paginates(vec_db, mock_collection):
+    ids = [str(uuid.uuid4()) for _ in range(5)]
+
+    def fake_get(where, limit, offset, include):
+        page = ids[offset : offset + limit]
+        return {"ids": page, "embeddings": None, "metadatas": [{"tag": "sample"}] * len(page)}
+
+    mock_collection.get.side_effect = fake_get
+    results = list(vec_db.iter_by_filter({"tag": "sample"}, page_size=2))
+    assert [r.id for r in results] == ids
+    assert mock_collection.get.call_count == 3
+
+    mock_collection.get.reset_mock()
+    results = vec_db.get_by_filter({"tag": "sample"}, limit=3)
+    assert [r.id for r in results] == ids[:3]
+    mock_collection.get.assert_called_once()
+
+
+def test_encode_auth():
+    header = ChromaVecDB._encode_auth("user", "pass")
+    assert header == "Basic dXNlcjpwYXNz"
+
+
+def test_search_results_are_cached(vec_db, mock_collection):
+    vec_db._search_cache.max_size = 8
+    mock_collection.query.return_value = {
+        "ids": [[str(uuid.uuid4())]],
+        "embeddings": None,
+        "metadatas": [[{"tag": "sample"}]],
+        "distances": [[0.1]],
+    }
+    first = vec_db.search([0.1, 0.2, 0.3], top_k=1)
+    first[0].payload["tag"] = "edited"
+    second = vec_db.search([0.1, 0.2, 0.3], top_k=1)
+    assert second[0].payload == {"tag": "sample"}
+    assert second[0] is not first[0]
+    mock_collection.query.assert_called_once()
+
+    vec_db.search([0.1, 0.2, 0.3], top_k=1, filter={"tag": "sample"})
+    assert mock_collection.query.call_count == 2
+
+    vec_db.delete(["1"])
+    vec_db.search([0.1, 0.2, 0.3], top_k=1)
+    assert mock_collection.query.call_count == 3
+
+
+def test_http_client_pool_settings():
+    config = VectorDBConfigFactory.model_validate(
+        {
+            "backend": "chroma",
+            "config": {
+                "collection_name": "test_collection",
+                "host": "localhost",
+                "port": 8000,
+                "max_connections": 16,
+                "max_keepalive_connections": 8,
+            },
+        }
+    )
+    with patch("chromadb.HttpClient") as mock_http_client:
+        VecDBFactory.from_config(config).close()
+    kwargs = mock_http_client.call_args.kwargs
+    assert kwargs["headers"]["Authorization"].startswith("Basic ")
+    settings = kwargs["settings"]
+    if not hasattr(settings, "chroma_http_max_connections"):
+        pytest.skip("Installed chromadb does not expose HTTP pool settings")
+    assert settings.chroma_http_max_connections == 16
+    assert settings.chroma_http_max_keepalive_connections == 8
+
+
+def test_client_shared_between_instances(config, vec_db, mock_chroma_client):
+    other = VecDBFactory.from_config(config)
+    assert other.client is vec_db.client
+    mock_chroma_client.assert_called_once()
+
+    other.close()
+    other.close()
+    assert ChromaVecDB._client_refs[ChromaVecDB._get_client_key(vec_db.config)] == 1
+    vec_db.client.close.assert_not_called()
+    vec_db.close()
+    mock_chroma_client.return_value.close.assert_called_once()
+    assert not ChromaVecDB._clients
+
+    resized_config = config.model_copy(deep=True)
+    resized_config.config.max_connections = 8
+    resized = VecDBFactory.from_config(resized_config)
+    assert mock_chroma_client.call_count == 2
+    resized.close()
+
+
+def test_get_by_ids_uses_id_cache(vec_db, mock_collection):
+    vec_db._id_cache.max_size = 8
+    ids = [str(uuid.uuid4()), str(uuid.uuid4())]
+    mock_collection.get.return_value = {
+        "ids": ids[:1],
+        "embeddings": [[0.1, 0.2, 0.3]],
+        "metadatas": [{"tag": "sample"}],
+    }
+    vec_db.get_by_ids(ids[:1])[0].payload["tag"] = "edited"
+    cached = vec_db.get_by_id(ids[0])
+    assert cached.vector == [0.1, 0.2, 0.3]
+    assert cached.payload == {"tag": "sample"}
+    mock_collection.get.assert_called_once()
+
+    mock_collection.get.return_value = {
+        "ids": ids[1:],
+        "embeddings": [[0.4, 0.5, 0.6]],
+        "metadatas": [{"tag": "other"}],
+    }
+    results = vec_db.get_by_ids(ids)
+    assert [r.id for r in results] == ids
+    assert mock_collection.get.call_args.kwargs["ids"] == ids[1:]
+
+    vec_db.delete(ids[:1])
+    vec_db.get_by_id(ids[0])
+    assert mock_collection.get.call_args.kwargs["ids"] == ids[:1]
+
+
+def test_failed_write_invalidates_id_cache(vec_db, mock_collection):
+    vec_db._id_cache.max_size = 8
+    id = str(uuid.uuid4())
+    mock_collection.get.return_value = {
+        "ids": [id],
+        "embeddings": [[0.1, 0.2, 0.3]],
+        "metadatas": [{"tag": "sample"}],
+    }
+    vec_db.get_by_id(id)
+    mock_collection.upsert.side_effect = RuntimeError("upsert failed")
+    with pytest.raises(RuntimeError):
+        vec_db.add([{"id": id, "vector": [0.4, 0.5, 0.6], "payload": {"memory": "mem"}}])
+    vec_db.get_by_id(id)
+    assert mock_collection.get.call_count == 2
+
+
+def test_id_cache_disabled_by_default(vec_db, mock_collection):
+    id = str(uuid.uuid4())
+    mock_collection.get.return_value = {
+        "ids": [id],
+        "embeddings": [[0.1, 0.2, 0.3]],
+        "metadatas": [{"tag": "sample"}],
+    }
+    vec_db.get_by_id(id)
+    vec_db.get_by_id(id)
+    assert mock_collection.get.call_count == 2
+
+
+def test_read_overlapping_write_is_not_cached(vec_db, mock_collection):
+    vec_db._id_cache.max_size = 8
+    id = str(uuid.uuid4())
+
+    def get_during_delete(ids, include):
+        vec_db.delete([id])
+        return {"ids": [id], "embeddings": [[0.1, 0.2, 0.3]], "metadatas": [{"tag": "old"}]}
+
+    mock_collection.get.side_effect = get_during_delete
+    vec_db.get_by_id(id)
+    vec_db.get_by_id(id)
+    assert mock_collection.get.call_count == 2